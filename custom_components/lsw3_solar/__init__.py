@@ -3,15 +3,26 @@ import logging
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import DOMAIN, CONF_IP_ADDRESS, CONF_PORT, CONF_SERIAL_NUMBER, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_IP_ADDRESS,
+    CONF_PORT,
+    CONF_SERIAL_NUMBER,
+    CONF_SCAN_INTERVAL,
+    CONF_ENERGY_STATISTICS,
+    CONF_STATISTICS_BATCH_HOURS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STATISTICS_BATCH_HOURS,
+)
+from .energy_statistics import LSW3EnergyStatistics
 from .lsw3_protocol import LSW3Reader
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +43,12 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     port = conf.get(CONF_PORT, 8899)
     serial_number = conf[CONF_SERIAL_NUMBER]
     scan_interval = conf.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    energy_statistics = conf.get(CONF_ENERGY_STATISTICS, False)
+    statistics_batch_hours = conf.get(CONF_STATISTICS_BATCH_HOURS, DEFAULT_STATISTICS_BATCH_HOURS)
+
+    if energy_statistics and "recorder" not in hass.config.components:
+        _LOGGER.warning("Recorder is not loaded, disabling %s", CONF_ENERGY_STATISTICS)
+        energy_statistics = False
 
     coordinator = LSW3DataUpdateCoordinator(
         hass,
@@ -39,8 +56,19 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         port=port,
         serial_number=serial_number,
         scan_interval=scan_interval,
+        energy_statistics=energy_statistics,
+        statistics_batch_hours=statistics_batch_hours,
     )
 
+    if coordinator.energy_statistics:
+
+        @callback
+        def _async_flush_statistics(event: Event) -> None:
+            """Import buffered statistics, including the current hour, on shutdown."""
+            coordinator.energy_statistics.async_import(include_current=True)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_statistics)
+
     # Initial data fetch
     await coordinator.async_refresh()
 
@@ -66,12 +94,19 @@ class LSW3DataUpdateCoordinator(DataUpdateCoordinator):
         port: int,
         serial_number: int,
         scan_interval: int,
+        energy_statistics: bool = False,
+        statistics_batch_hours: int = DEFAULT_STATISTICS_BATCH_HOURS,
     ) -> None:
         """Initialize."""
         self.ip_address = ip_address
         self.port = port
         self.serial_number = serial_number
         self.reader = LSW3Reader(ip_address, port, serial_number)
+        self.energy_statistics = None
+        if energy_statistics:
+            self.energy_statistics = LSW3EnergyStatistics(
+                hass, serial_number, statistics_batch_hours
+            )
 
         super().__init__(
             hass,
@@ -87,8 +122,14 @@ class LSW3DataUpdateCoordinator(DataUpdateCoordinator):
             await self.hass.async_add_executor_job(
                 self.reader.read_all
             )
-
-            return self.reader.data
-
         except Exception as err:
             raise UpdateFailed(f"Error communicating with LSW-3: {err}") from err
+
+        if self.energy_statistics:
+            try:
+                await self.energy_statistics.async_process(self.reader.data)
+            except Exception:  # pylint: disable=broad-except
+                # Statistics problems must not make the live sensors unavailable
+                _LOGGER.exception("Error updating LSW-3 energy statistics")
+
+        return self.reader.data
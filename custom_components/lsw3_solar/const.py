@@ -7,10 +7,26 @@ CONF_IP_ADDRESS = "ip_address"
 CONF_PORT = "port"
 CONF_SERIAL_NUMBER = "serial_number"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ENERGY_STATISTICS = "energy_statistics"
+CONF_STATISTICS_BATCH_HOURS = "statistics_batch_hours"
 
 # Defaults
 DEFAULT_PORT = 8899
 DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_STATISTICS_BATCH_HOURS = 1
+
+# Energy counters aggregated into long-term statistics.
+# Counters marked True reset at local midnight; all are U32 registers.
+ENERGY_COUNTERS = {
+    "pv_generation_today": True,
+    "pv_generation_total": False,
+    "load_consumption_today": True,
+    "load_consumption_total": False,
+    "energy_purchase_today": True,
+    "energy_purchase_total": False,
+    "energy_selling_today": True,
+    "energy_selling_total": False,
+}
 
 # Sensor types
 SENSOR_TYPES = {
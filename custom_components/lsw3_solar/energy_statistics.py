@@ -0,0 +1,243 @@
+"""Hourly energy statistics aggregation for LSW-3 Solar integration."""
+import logging
+from datetime import datetime
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ENERGY_COUNTERS, SENSOR_TYPES
+
+_LOGGER = logging.getLogger(__name__)
+
+U32_MODULUS = 1 << 32
+
+# Plausibility bound for a change between two samples: the inverter, grid or
+# load cannot move more energy than this in the elapsed time.
+MAX_POWER_KW = 50.0
+MAX_DELTA_SLACK_KWH = 0.5
+
+# Consecutive rejected readings after which the counter is re-baselined
+MAX_REJECTED_READINGS = 5
+
+
+class EnergyCounter:
+    """Hourly aggregation state for a single energy counter."""
+
+    def __init__(self, statistic_id: str, name: str, resets_daily: bool) -> None:
+        """Initialize."""
+        self.statistic_id = statistic_id
+        self.name = name
+        self.resets_daily = resets_daily
+        self.last_raw = None
+        self.last_time = None
+        self.reset_date = None
+        self.rejected = 0
+        self.sum = 0.0
+        self.bucket_start = None
+        self.bucket_state = None
+        self.restored_state = None
+        self.pending = []
+
+    def restore(self, last: dict) -> None:
+        """Resume from the last imported statistic row."""
+        self.sum = last["sum"] or 0.0
+        self.restored_state = last.get("state")
+        self.bucket_start = dt_util.utc_from_timestamp(last["start"])
+
+    def resume(self, factor: float, now: datetime) -> None:
+        """Derive the raw baseline from the restored state on the first sample."""
+        self.last_raw = round(self.restored_state / factor)
+        self.last_time = self.bucket_start
+        self.reset_date = dt_util.as_local(self.bucket_start).date()
+        self.restored_state = None
+
+        today = dt_util.as_local(now).date()
+        if self.resets_daily and today != self.reset_date:
+            # Down across midnight: today's counter started from zero
+            self.last_raw = 0
+            self.reset_date = today
+
+    def max_delta(self, now: datetime) -> float:
+        """Return the largest plausible energy change since the last sample."""
+        hours = (now - self.last_time).total_seconds() / 3600
+        return MAX_POWER_KW * max(hours, 0) + MAX_DELTA_SLACK_KWH
+
+    def delta(self, raw: int, factor: float, now: datetime):
+        """Return energy since the previous sample, or None for a rejected read."""
+        if self.last_raw is None:
+            return 0.0
+
+        limit = self.max_delta(now)
+
+        if raw >= self.last_raw:
+            delta = (raw - self.last_raw) * factor
+            return delta if delta <= limit else None
+
+        if self.resets_daily:
+            # Accept one reset per local day, and only to a value the counter
+            # could have reached since the previous sample
+            today = dt_util.as_local(now).date()
+            if today != self.reset_date and raw * factor <= limit:
+                self.reset_date = today
+                return raw * factor
+            return None
+
+        # Lifetime counters only go backwards on a U32 wrap
+        delta = (raw + U32_MODULUS - self.last_raw) * factor
+        return delta if delta <= limit else None
+
+    def add_sample(self, raw: int, factor: float, now: datetime) -> None:
+        """Accumulate a sample into the current hourly bucket."""
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if self.bucket_start is not None and hour > self.bucket_start:
+            self.close_bucket()
+        self.bucket_start = hour
+
+        if self.last_raw is None:
+            self.reset_date = dt_util.as_local(now).date()
+
+        delta = self.delta(raw, factor, now)
+        if delta is None:
+            self.rejected += 1
+            if self.rejected < MAX_REJECTED_READINGS:
+                _LOGGER.debug(
+                    "Ignoring implausible %s reading %d (previous %d)",
+                    self.statistic_id,
+                    raw,
+                    self.last_raw,
+                )
+                if self.bucket_state is None:
+                    self.bucket_state = self.last_raw * factor
+                return
+
+            _LOGGER.warning(
+                "Re-baselining %s at %d after %d implausible readings (previous %d)",
+                self.statistic_id,
+                raw,
+                self.rejected,
+                self.last_raw,
+            )
+            if self.resets_daily and raw < self.last_raw:
+                self.reset_date = dt_util.as_local(now).date()
+            delta = 0.0
+
+        self.rejected = 0
+        self.sum += delta
+        self.last_raw = raw
+        self.last_time = now
+        self.bucket_state = raw * factor
+
+    def close_bucket(self) -> None:
+        """Move the current hourly bucket to the import queue."""
+        if self.bucket_start is None or self.bucket_state is None:
+            return
+        self.pending.append(
+            StatisticData(
+                start=self.bucket_start,
+                state=self.bucket_state,
+                sum=self.sum,
+            )
+        )
+        self.bucket_state = None
+
+
+class LSW3EnergyStatistics:
+    """Aggregate energy counters into hourly external statistics."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        serial_number: int,
+        batch_hours: int,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.batch_hours = max(1, batch_hours)
+        self._restored = False
+        self.counters = {}
+
+        for key, resets_daily in ENERGY_COUNTERS.items():
+            name = SENSOR_TYPES.get(key, {}).get("name", key.replace("_", " ").title())
+            self.counters[key] = EnergyCounter(
+                f"{DOMAIN}:{serial_number}_{key}",
+                f"LSW-3 {name}",
+                resets_daily,
+            )
+
+    async def _async_restore(self) -> None:
+        """Load the last imported sum for each counter from the recorder."""
+        recorder = get_instance(self.hass)
+        for counter in self.counters.values():
+            last = await recorder.async_add_executor_job(
+                get_last_statistics,
+                self.hass,
+                1,
+                counter.statistic_id,
+                True,
+                {"state", "sum"},
+            )
+            rows = last.get(counter.statistic_id)
+            if rows:
+                counter.restore(rows[0])
+        self._restored = True
+
+    async def async_process(self, data: dict) -> None:
+        """Feed a coordinator poll into the hourly buckets."""
+        if not self._restored:
+            await self._async_restore()
+
+        now = dt_util.utcnow()
+        for key, counter in self.counters.items():
+            sample = data.get(key)
+            if not sample:
+                continue
+            if counter.last_raw is None and counter.restored_state is not None:
+                counter.resume(sample["factor"], now)
+            counter.add_sample(sample["raw"], sample["factor"], now)
+
+        if any(len(c.pending) >= self.batch_hours for c in self.counters.values()):
+            self.async_import()
+
+    def async_import(self, include_current: bool = False) -> None:
+        """Import queued hourly buckets through the recorder."""
+        for counter in self.counters.values():
+            statistics = list(counter.pending)
+            if include_current and counter.bucket_state is not None:
+                # Partial hour; later imports for the same start overwrite it
+                statistics.append(
+                    StatisticData(
+                        start=counter.bucket_start,
+                        state=counter.bucket_state,
+                        sum=counter.sum,
+                    )
+                )
+            if not statistics:
+                continue
+
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=counter.name,
+                source=DOMAIN,
+                statistic_id=counter.statistic_id,
+                unit_class="energy",
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+            counter.pending.clear()
+            _LOGGER.debug(
+                "Imported %d hourly statistics for %s",
+                len(statistics),
+                counter.statistic_id,
+            )
@@ -125,12 +125,9 @@ class LSW3Reader:
         else:
             return None
 
-        if factor:
-            value = raw * float(factor)
-        else:
-            value = raw
+        scale = float(factor) if factor else 1
 
-        return {"raw": raw, "value": value, "type": value_type}
+        return {"raw": raw, "value": raw * scale, "type": value_type, "factor": scale}
 
     def read_energy_totals(self):
         """Read energy production and consumption totals"""
@@ -15,7 +15,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES
+from .const import DOMAIN, ENERGY_COUNTERS, SENSOR_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +49,10 @@ class LSW3Sensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = SENSOR_TYPES[sensor_type].get("device_class")
         self._attr_state_class = SENSOR_TYPES[sensor_type].get("state_class")
 
+        if coordinator.energy_statistics and sensor_type in ENERGY_COUNTERS:
+            # Long-term statistics are imported by the coordinator instead
+            self._attr_state_class = None
+
         # Set native unit
         unit = SENSOR_TYPES[sensor_type].get("unit", "")
         if unit == "kWh":
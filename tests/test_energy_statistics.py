@@ -0,0 +1,202 @@
+"""Tests for LSW-3 hourly energy statistics aggregation."""
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.lsw3_solar import energy_statistics  # noqa: E402
+from custom_components.lsw3_solar.energy_statistics import (  # noqa: E402
+    MAX_REJECTED_READINGS,
+    U32_MODULUS,
+    EnergyCounter,
+    LSW3EnergyStatistics,
+)
+
+DAILY_FACTOR = 0.01
+TOTAL_FACTOR = 0.1
+
+
+def utc(hour, minute=0, day=1):
+    """Return a UTC timestamp on a fixed test date."""
+    return datetime(2026, 6, day, hour, minute, tzinfo=timezone.utc)
+
+
+def daily_counter():
+    return EnergyCounter("lsw3_solar:1_pv_generation_today", "PV Today", True)
+
+
+def total_counter():
+    return EnergyCounter("lsw3_solar:1_pv_generation_total", "PV Total", False)
+
+
+def test_first_sample_sets_baseline():
+    counter = total_counter()
+    counter.add_sample(1000, TOTAL_FACTOR, utc(10))
+    assert counter.sum == 0.0
+    assert counter.last_raw == 1000
+    assert counter.bucket_state == pytest.approx(100.0)
+
+
+def test_increasing_counter_accumulates():
+    counter = total_counter()
+    counter.add_sample(1000, TOTAL_FACTOR, utc(10))
+    counter.add_sample(1025, TOTAL_FACTOR, utc(10, 30))
+    assert counter.sum == pytest.approx(2.5)
+
+
+def test_midnight_reset_after_poll():
+    """Inverter clock lags: first poll after midnight still has yesterday's total."""
+    counter = daily_counter()
+    counter.add_sample(3000, DAILY_FACTOR, utc(23, 59, day=1))
+    counter.add_sample(3010, DAILY_FACTOR, utc(0, 0, day=2))
+    assert counter.sum == pytest.approx(0.1)
+    counter.add_sample(5, DAILY_FACTOR, utc(0, 1, day=2))
+    assert counter.sum == pytest.approx(0.15)
+
+
+def test_midnight_reset_before_poll():
+    counter = daily_counter()
+    counter.add_sample(3000, DAILY_FACTOR, utc(23, 59, day=1))
+    counter.add_sample(5, DAILY_FACTOR, utc(0, 0, day=2))
+    assert counter.sum == pytest.approx(0.05)
+
+
+def test_midday_low_reading_on_daily_counter_is_ignored():
+    counter = daily_counter()
+    counter.add_sample(3000, DAILY_FACTOR, utc(12))
+    counter.add_sample(0, DAILY_FACTOR, utc(12, 1))
+    counter.add_sample(3005, DAILY_FACTOR, utc(12, 2))
+    assert counter.sum == pytest.approx(0.05)
+    assert counter.last_raw == 3005
+
+
+def test_only_one_daily_reset_per_day():
+    counter = daily_counter()
+    counter.add_sample(3000, DAILY_FACTOR, utc(23, 59, day=1))
+    counter.add_sample(5, DAILY_FACTOR, utc(0, 1, day=2))
+    counter.add_sample(500, DAILY_FACTOR, utc(2, 0, day=2))
+    counter.add_sample(0, DAILY_FACTOR, utc(2, 1, day=2))
+    assert counter.sum == pytest.approx(5.0)
+    assert counter.last_raw == 500
+
+
+def test_glitch_read_on_total_counter_is_ignored():
+    counter = total_counter()
+    counter.add_sample(500000, TOTAL_FACTOR, utc(10))
+    counter.add_sample(0, TOTAL_FACTOR, utc(10, 1))
+    assert counter.sum == 0.0
+    assert counter.last_raw == 500000
+    assert counter.bucket_state == pytest.approx(50000.0)
+
+    counter.add_sample(500010, TOTAL_FACTOR, utc(10, 2))
+    assert counter.sum == pytest.approx(1.0)
+
+
+def test_upward_spike_on_total_counter_is_ignored():
+    counter = total_counter()
+    counter.add_sample(500000, TOTAL_FACTOR, utc(10))
+    counter.add_sample(0xFFFFFFF0, TOTAL_FACTOR, utc(10, 1))
+    counter.add_sample(500010, TOTAL_FACTOR, utc(10, 2))
+    counter.add_sample(500020, TOTAL_FACTOR, utc(10, 3))
+    assert counter.sum == pytest.approx(2.0)
+    assert counter.last_raw == 500020
+
+
+def test_rebaseline_after_repeated_rejections():
+    counter = total_counter()
+    counter.add_sample(500000, TOTAL_FACTOR, utc(10))
+    for minute in range(1, MAX_REJECTED_READINGS + 1):
+        counter.add_sample(100, TOTAL_FACTOR, utc(10, minute))
+    assert counter.sum == 0.0
+    assert counter.last_raw == 100
+
+    counter.add_sample(110, TOTAL_FACTOR, utc(10, 30))
+    assert counter.sum == pytest.approx(1.0)
+
+
+def test_u32_wrap_on_total_counter():
+    counter = total_counter()
+    counter.add_sample(U32_MODULUS - 5, TOTAL_FACTOR, utc(10))
+    counter.add_sample(5, TOTAL_FACTOR, utc(10, 1))
+    assert counter.sum == pytest.approx(1.0)
+    assert counter.last_raw == 5
+
+
+def test_hour_rollover_across_skipped_hours():
+    counter = total_counter()
+    counter.add_sample(1000, TOTAL_FACTOR, utc(10, 5))
+    counter.add_sample(1010, TOTAL_FACTOR, utc(10, 55))
+    counter.add_sample(1050, TOTAL_FACTOR, utc(14, 10))
+
+    assert len(counter.pending) == 1
+    assert counter.pending[0]["start"] == utc(10)
+    assert counter.pending[0]["sum"] == pytest.approx(1.0)
+    assert counter.bucket_start == utc(14)
+    assert counter.sum == pytest.approx(5.0)
+
+    counter.add_sample(1060, TOTAL_FACTOR, utc(15, 0))
+    assert [row["start"] for row in counter.pending] == [utc(10), utc(14)]
+    assert counter.pending[1]["sum"] == pytest.approx(5.0)
+
+
+def test_close_bucket_without_new_sample_is_noop():
+    counter = total_counter()
+    counter.add_sample(1000, TOTAL_FACTOR, utc(10))
+    counter.close_bucket()
+    counter.close_bucket()
+    assert len(counter.pending) == 1
+
+
+def test_restore_resumes_sum_and_baseline():
+    stats = LSW3EnergyStatistics(hass=None, serial_number=1, batch_hours=1)
+    stats._restored = True
+    counter = stats.counters["pv_generation_total"]
+    counter.restore({"start": utc(9).timestamp(), "state": 100.0, "sum": 42.0})
+
+    with patch.object(energy_statistics.dt_util, "utcnow", return_value=utc(9, 40)):
+        asyncio.run(
+            stats.async_process(
+                {"pv_generation_total": {"raw": 1020, "factor": TOTAL_FACTOR}}
+            )
+        )
+
+    assert counter.sum == pytest.approx(44.0)
+    assert counter.pending == []
+    assert counter.bucket_start == utc(9)
+
+
+def test_partial_hour_flush():
+    stats = LSW3EnergyStatistics(hass=None, serial_number=1, batch_hours=3)
+    counter = stats.counters["pv_generation_total"]
+    counter.add_sample(1000, TOTAL_FACTOR, utc(10))
+    counter.add_sample(1030, TOTAL_FACTOR, utc(11, 20))
+
+    with patch.object(energy_statistics, "async_add_external_statistics") as add:
+        stats.async_import(include_current=True)
+
+    assert add.call_count == 1
+    metadata, rows = add.call_args.args[1:]
+    assert metadata["statistic_id"] == "lsw3_solar:1_pv_generation_total"
+    assert [row["start"] for row in rows] == [utc(10), utc(11)]
+    assert rows[1]["sum"] == pytest.approx(3.0)
+    assert counter.pending == []
+    assert counter.bucket_state is not None
+
+
+def test_restore_daily_counter_same_day():
+    counter = daily_counter()
+    counter.restore({"start": utc(7).timestamp(), "state": 30.0, "sum": 10.0})
+    counter.resume(DAILY_FACTOR, utc(8))
+    counter.add_sample(3500, DAILY_FACTOR, utc(8))
+    assert counter.sum == pytest.approx(15.0)
+
+
+def test_restore_daily_counter_across_midnight():
+    counter = daily_counter()
+    counter.restore({"start": utc(22, day=1).timestamp(), "state": 30.0, "sum": 10.0})
+    counter.resume(DAILY_FACTOR, utc(8, day=2))
+    counter.add_sample(3500, DAILY_FACTOR, utc(8, day=2))
+    assert counter.sum == pytest.approx(45.0)